@@ -5,10 +5,12 @@
 use anyhow::{Context, Result};
 use clap::{Parser, Subcommand};
 use colored::Colorize;
-use heck::ToPascalCase;
 use serde::Deserialize;
+use std::collections::{BTreeMap, BTreeSet, HashMap};
 use std::fs;
+use std::io::{self, BufRead};
 use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex, OnceLock};
 use tera::Tera;
 
 /// Aegis Architect - アーキタイプベースのスキャフォールドツール
@@ -76,6 +78,18 @@ struct FileSpec {
     layer: String,
 }
 
+/// レジストリの1エントリ（読み込みに失敗した場合はエラー内容を保持）
+type ArchetypeEntry = Result<Arc<Manifest>, String>;
+
+/// アーキタイプのレジストリ（ディレクトリ名 -> マニフェスト）
+type ArchetypeRegistry = BTreeMap<String, ArchetypeEntry>;
+
+/// アーキタイプディレクトリごとのレジストリ
+///
+/// 初回アクセス時に走査し、最初に登録されたものを以降も使い続ける（1回の実行で終わるCLIのため）。
+static ARCHETYPE_REGISTRIES: OnceLock<Mutex<HashMap<PathBuf, Arc<ArchetypeRegistry>>>> =
+    OnceLock::new();
+
 fn main() -> Result<()> {
     let cli = Cli::parse();
 
@@ -112,14 +126,19 @@ fn main() -> Result<()> {
             archetype,
             target,
             no_mod_update,
-        } => scaffold_feature(
-            &archetypes_dir,
-            &name,
-            &description,
-            &archetype,
-            &target,
-            !no_mod_update,
-        ),
+        } => {
+            // マニフェストはここで一度だけ読み込み、scaffold_featureに渡す
+            let manifest = load_archetype(&archetypes_dir, &archetype)?;
+            scaffold_feature(
+                &archetypes_dir,
+                &name,
+                &description,
+                &archetype,
+                &target,
+                !no_mod_update,
+                Some(manifest),
+            )
+        }
     }
 }
 
@@ -154,9 +173,24 @@ fn list_archetypes(archetypes_dir: &Path) -> Result<()> {
     Ok(())
 }
 
-/// 全アーキタイプを読み込む
-fn load_all_archetypes(archetypes_dir: &Path) -> Result<Vec<Manifest>> {
-    let mut result = Vec::new();
+/// マニフェストを読み込む
+///
+/// マニフェストが存在しない場合は `None` を返す。
+fn load_manifest(manifest_path: &Path) -> Result<Option<Manifest>> {
+    // バイト列のまま渡す（UTF-8検証はパース中に一度だけ行われる）
+    let content = match fs::read(manifest_path) {
+        Ok(content) => content,
+        Err(e) if e.kind() == io::ErrorKind::NotFound => return Ok(None),
+        Err(e) => return Err(e.into()),
+    };
+    let manifest = serde_json::from_slice(&content)
+        .with_context(|| format!("Failed to parse manifest: {:?}", manifest_path))?;
+    Ok(Some(manifest))
+}
+
+/// アーキタイプディレクトリを走査してレジストリを構築する
+fn scan_archetypes(archetypes_dir: &Path) -> Result<ArchetypeRegistry> {
+    let mut registry = ArchetypeRegistry::new();
 
     for entry in fs::read_dir(archetypes_dir)
         .with_context(|| format!("Failed to read archetypes directory: {:?}", archetypes_dir))?
@@ -164,45 +198,148 @@ fn load_all_archetypes(archetypes_dir: &Path) -> Result<Vec<Manifest>> {
         let entry = entry?;
         let path = entry.path();
 
-        if path.is_dir() {
-            let manifest_path = path.join("manifest.json");
-            if manifest_path.exists() {
-                let content = fs::read_to_string(&manifest_path)?;
-                let manifest: Manifest = serde_json::from_str(&content)
-                    .with_context(|| format!("Failed to parse manifest: {:?}", manifest_path))?;
-                result.push(manifest);
-            }
+        // file_type()はreaddirの結果を使うので追加のstatが不要（シンボリックリンクのみ辿る）
+        let file_type = entry.file_type()?;
+        if file_type.is_dir() || (file_type.is_symlink() && path.is_dir()) {
+            // 壊れたマニフェストがあっても走査は続け、参照されたときにエラーにする
+            let entry_result = match load_manifest(&path.join("manifest.json")) {
+                Ok(Some(manifest)) => Ok(Arc::new(manifest)),
+                Ok(None) => continue,
+                Err(e) => Err(format!("{:#}", e)),
+            };
+            let dir_name = entry.file_name().to_string_lossy().into_owned();
+            registry.insert(dir_name, entry_result);
         }
     }
 
+    Ok(registry)
+}
+
+/// アーキタイプのレジストリを取得する（未構築なら走査する）
+fn archetype_registry(archetypes_dir: &Path) -> Result<Arc<ArchetypeRegistry>> {
+    let registries = ARCHETYPE_REGISTRIES.get_or_init(Default::default);
+
+    if let Some(registry) = registries.lock().unwrap().get(archetypes_dir) {
+        return Ok(Arc::clone(registry));
+    }
+
+    // 走査はロック外で行い、同時に走査した場合は先に登録されたものを使う
+    let registry = Arc::new(scan_archetypes(archetypes_dir)?);
+    let registry = registries
+        .lock()
+        .unwrap()
+        .entry(archetypes_dir.to_path_buf())
+        .or_insert(registry)
+        .clone();
+    Ok(registry)
+}
+
+/// 全アーキタイプを読み込む
+fn load_all_archetypes(archetypes_dir: &Path) -> Result<Vec<Arc<Manifest>>> {
+    let mut result = archetype_registry(archetypes_dir)?
+        .values()
+        .cloned()
+        .collect::<Result<Vec<_>, _>>()
+        .map_err(|message| anyhow::anyhow!("{}", message))?;
+
     // 名前でソート
     result.sort_by(|a, b| a.name.cmp(&b.name));
     Ok(result)
 }
 
 /// アーキタイプを読み込む
-fn load_archetype(archetypes_dir: &Path, name: &str) -> Result<Manifest> {
-    let manifest_path = archetypes_dir.join(name).join("manifest.json");
+fn load_archetype(archetypes_dir: &Path, name: &str) -> Result<Arc<Manifest>> {
+    let registry = archetype_registry(archetypes_dir)?;
 
-    if !manifest_path.exists() {
-        let available: Vec<_> = load_all_archetypes(archetypes_dir)?
-            .iter()
-            .map(|m| m.name.clone())
-            .collect();
+    match registry.get(name) {
+        Some(Ok(manifest)) => return Ok(Arc::clone(manifest)),
+        Some(Err(message)) => anyhow::bail!("Failed to load archetype '{}': {}", name, message),
+        None => {}
+    }
 
-        anyhow::bail!(
-            "Archetype '{}' not found. Available: {}",
-            name,
-            available.join(", ")
-        );
+    // 候補には読み込めたアーキタイプだけを示す
+    let mut available: Vec<_> = registry
+        .values()
+        .filter_map(|entry| entry.as_ref().ok())
+        .map(|m| m.name.as_str())
+        .collect();
+    available.sort_unstable();
+
+    anyhow::bail!(
+        "Archetype '{}' not found. Available: {}",
+        name,
+        available.join(", ")
+    );
+}
+
+/// 出力パス用テンプレートの登録名
+fn output_template_name(file_spec: &FileSpec) -> String {
+    format!("output:{}", file_spec.output)
+}
+
+/// コンパイル済みテンプレート
+///
+/// Teraのタグを含まないテンプレートはコンパイルせず、定数文字列として保持する。
+struct CompiledTemplates {
+    tera: Tera,
+    constants: HashMap<String, String>,
+}
+
+impl CompiledTemplates {
+    /// `(登録名, ソース)` の組をまとめてコンパイルする（タグがなければ定数として畳み込む）
+    fn new(sources: Vec<(String, String)>) -> tera::Result<Self> {
+        let mut tera = Tera::default();
+        // Tera::one_off(.., false) と同様にエスケープは無効
+        tera.autoescape_on(vec![]);
+
+        let (constants, templates): (Vec<_>, Vec<_>) = sources
+            .into_iter()
+            .partition(|(_, source)| is_constant_template(source));
+
+        // 一度の呼び出しで登録し、継承チェーンの構築を一回で済ませる
+        tera.add_raw_templates(templates)?;
+
+        Ok(Self {
+            tera,
+            constants: constants.into_iter().collect(),
+        })
     }
 
-    let content = fs::read_to_string(&manifest_path)?;
-    let manifest: Manifest = serde_json::from_str(&content)?;
-    Ok(manifest)
+    fn render(&self, name: &str, context: &tera::Context) -> tera::Result<String> {
+        match self.constants.get(name) {
+            Some(constant) => Ok(constant.clone()),
+            None => self.tera.render(name, context),
+        }
+    }
+}
+
+/// Teraのタグ（式・文・コメント）を含まないか
+fn is_constant_template(source: &str) -> bool {
+    !["{{", "{%", "{#"].iter().any(|tag| source.contains(tag))
+}
+
+/// アーキタイプのテンプレートをまとめてコンパイルする
+fn compile_templates(archetype_dir: &Path, manifest: &Manifest) -> Result<CompiledTemplates> {
+    let mut sources = Vec::with_capacity(manifest.files.len() * 2);
+
+    for file_spec in &manifest.files {
+        let template_path = archetype_dir.join(&file_spec.template);
+        let template_content = fs::read_to_string(&template_path)
+            .with_context(|| format!("Failed to read template: {:?}", template_path))?;
+
+        sources.push((file_spec.template.clone(), template_content));
+
+        // 出力パスも同じエンジンで変数置換する
+        sources.push((output_template_name(file_spec), file_spec.output.clone()));
+    }
+
+    CompiledTemplates::new(sources)
+        .with_context(|| format!("Failed to compile templates in: {:?}", archetype_dir))
 }
 
 /// スキャフォールドを生成
+///
+/// `manifest` が `None` の場合は `archetype` から読み込む。
 fn scaffold_feature(
     archetypes_dir: &Path,
     name: &str,
@@ -210,10 +347,11 @@ fn scaffold_feature(
     archetype: &str,
     target: &Path,
     update_mod: bool,
+    manifest: Option<Arc<Manifest>>,
 ) -> Result<()> {
     // 名前を正規化
     let snake_name = to_snake_case(name);
-    let pascal_name = snake_name.to_pascal_case();
+    let pascal_name = to_pascal_case(&snake_name);
 
     println!("{}", "=".repeat(60));
     println!(
@@ -226,8 +364,11 @@ fn scaffold_feature(
     println!("Target:    {}", target.display().to_string().cyan());
     println!("{}\n", "=".repeat(60));
 
-    // マニフェスト読み込み
-    let manifest = load_archetype(archetypes_dir, archetype)?;
+    // マニフェスト読み込み（呼び出し側で読み込み済みならそれを使う）
+    let manifest = match manifest {
+        Some(manifest) => manifest,
+        None => load_archetype(archetypes_dir, archetype)?,
+    };
     println!(
         "Using archetype: {}",
         manifest.display_name.bold()
@@ -240,44 +381,66 @@ fn scaffold_feature(
     context.insert("pascal_name", &pascal_name);
     context.insert("description", description);
 
-    // ファイル生成
+    // テンプレートを一度だけコンパイル
     let archetype_dir = archetypes_dir.join(archetype);
-    let mut generated = Vec::new();
+    let templates = compile_templates(&archetype_dir, &manifest)?;
 
-    println!("Generated files:");
+    // 全ファイルを先にレンダリング
+    let mut rendered_files = Vec::new();
 
     for file_spec in &manifest.files {
-        // テンプレート読み込み
-        let template_path = archetype_dir.join(&file_spec.template);
-        let template_content = fs::read_to_string(&template_path)
-            .with_context(|| format!("Failed to read template: {:?}", template_path))?;
-
         // Teraでレンダリング
-        let rendered = Tera::one_off(&template_content, &context, false)
+        let rendered = templates
+            .render(&file_spec.template, &context)
             .with_context(|| format!("Failed to render template: {}", file_spec.template))?;
 
         // 出力パスを生成（変数置換）
-        let output_path = file_spec
-            .output
-            .replace("{{name}}", &snake_name)
-            .replace("{{pascal_name}}", &pascal_name);
+        let output_path = templates
+            .render(&output_template_name(file_spec), &context)
+            .with_context(|| format!("Failed to render output path: {}", file_spec.output))?;
 
-        let full_path = target.join(&output_path);
+        rendered_files.push((target.join(&output_path), rendered));
+    }
 
-        // ディレクトリ作成
-        if let Some(parent) = full_path.parent() {
-            fs::create_dir_all(parent)?;
-        }
+    // ディレクトリ作成（重複する親ディレクトリは一度だけ）
+    let parents: BTreeSet<&Path> = rendered_files
+        .iter()
+        .filter_map(|(full_path, _)| full_path.parent())
+        .collect();
+    for parent in parents {
+        fs::create_dir_all(parent)?;
+    }
 
-        // ファイル書き込み
-        fs::write(&full_path, rendered)?;
+    // ファイル書き込み
+    let results = write_files(&rendered_files);
 
-        println!(
-            "  [{}] {}",
-            file_spec.layer.to_uppercase().green(),
-            full_path.display()
-        );
-        generated.push((file_spec.layer.clone(), full_path));
+    // ファイル生成
+    let mut generated = Vec::new();
+    let mut first_error = None;
+
+    println!("Generated files:");
+
+    for ((file_spec, (full_path, _)), result) in
+        manifest.files.iter().zip(rendered_files).zip(results)
+    {
+        // 一部が失敗しても、書き込めたファイルは表示する
+        match result {
+            Ok(()) => {
+                println!(
+                    "  [{}] {}",
+                    file_spec.layer.to_uppercase().green(),
+                    full_path.display()
+                );
+                generated.push((file_spec.layer.clone(), full_path));
+            }
+            Err(e) => {
+                first_error.get_or_insert(e);
+            }
+        }
+    }
+
+    if let Some(e) = first_error {
+        return Err(e);
     }
 
     // mod.rs更新（rust_hexagonalのみ）
@@ -307,6 +470,49 @@ fn scaffold_feature(
     Ok(())
 }
 
+/// この件数以下なら逐次に書き込む（数ファイルではスレッド生成が書き込みと同程度のコスト）
+const SEQUENTIAL_WRITE_LIMIT: usize = 4;
+
+/// 並行書き込みに使うスレッド数の上限
+const MAX_WRITER_THREADS: usize = 8;
+
+/// ファイルを書き込む
+fn write_file(path: &Path, contents: &str) -> Result<()> {
+    fs::write(path, contents).with_context(|| format!("Failed to write file: {:?}", path))
+}
+
+/// 複数ファイルを書き込み、ファイルごとの結果を入力順で返す
+///
+/// 件数が `SEQUENTIAL_WRITE_LIMIT` を超える場合のみスレッドに分散する。
+fn write_files(files: &[(PathBuf, String)]) -> Vec<Result<()>> {
+    if files.len() <= SEQUENTIAL_WRITE_LIMIT {
+        return files
+            .iter()
+            .map(|(path, contents)| write_file(path, contents))
+            .collect();
+    }
+    let chunk_size = files.len().div_ceil(MAX_WRITER_THREADS);
+
+    std::thread::scope(|scope| {
+        let writers: Vec<_> = files
+            .chunks(chunk_size)
+            .map(|chunk| {
+                scope.spawn(move || {
+                    chunk
+                        .iter()
+                        .map(|(path, contents)| write_file(path, contents))
+                        .collect::<Vec<_>>()
+                })
+            })
+            .collect();
+
+        writers
+            .into_iter()
+            .flat_map(|writer| writer.join().expect("writer thread panicked"))
+            .collect()
+    })
+}
+
 /// mod.rsファイルを更新
 fn update_mod_files(target: &Path, name: &str) -> Result<Vec<PathBuf>> {
     let mut updated = Vec::new();
@@ -324,48 +530,339 @@ fn update_mod_files(target: &Path, name: &str) -> Result<Vec<PathBuf>> {
     ];
 
     for (mod_path, mod_line) in mod_files {
-        let mod_line_with_newline = format!("{}\n", mod_line);
-
-        if mod_path.exists() {
-            let content = fs::read_to_string(&mod_path)?;
-            if !content.contains(&mod_line) {
-                let mut file = fs::OpenOptions::new().append(true).open(&mod_path)?;
-                std::io::Write::write_all(&mut file, mod_line_with_newline.as_bytes())?;
-                updated.push(mod_path);
+        let appended = update_mod_file(&mod_path, &mod_line)
+            .with_context(|| format!("Failed to update mod file: {:?}", mod_path))?;
+        if appended {
+            updated.push(mod_path);
+        }
+    }
+
+    Ok(updated)
+}
+
+/// mod.rsにモジュール宣言を追記する（追記・作成した場合はtrue）
+fn update_mod_file(mod_path: &Path, mod_line: &str) -> io::Result<bool> {
+    let mod_line_with_newline = format!("{}\n", mod_line);
+
+    // 読み込みと追記を同じハンドルで行う
+    match fs::OpenOptions::new()
+        .read(true)
+        .append(true)
+        .open(mod_path)
+    {
+        Ok(mut file) => match scan_mod_file(&file, mod_line)? {
+            ModLineScan::Found => return Ok(false),
+            ModLineScan::Missing { ends_with_newline } => {
+                // 末尾に改行がなければ補ってから追記する
+                let separator = if ends_with_newline { "" } else { "\n" };
+                let appended = format!("{}{}", separator, mod_line_with_newline);
+                io::Write::write_all(&mut file, appended.as_bytes())?;
             }
-        } else {
+        },
+        Err(e) if e.kind() == io::ErrorKind::NotFound => {
             if let Some(parent) = mod_path.parent() {
                 fs::create_dir_all(parent)?;
             }
-            fs::write(&mod_path, mod_line_with_newline)?;
-            updated.push(mod_path);
+            fs::write(mod_path, mod_line_with_newline)?;
         }
+        Err(e) => return Err(e),
     }
 
-    Ok(updated)
+    Ok(true)
+}
+
+/// mod.rsの走査結果
+enum ModLineScan {
+    /// 宣言が既にある
+    Found,
+    /// 宣言がない（ファイル末尾が改行で終わっているか）
+    Missing { ends_with_newline: bool },
 }
 
-/// snake_caseに変換
+/// mod.rsに指定の宣言があるか（見つかった時点で読み込みを打ち切る）
+///
+/// 行末の `//` コメントは無視して比較する。
+fn scan_mod_file(file: &fs::File, mod_line: &str) -> io::Result<ModLineScan> {
+    let mut reader = io::BufReader::new(file);
+    let mut line = String::new();
+    let mut ends_with_newline = true;
+
+    while reader.read_line(&mut line)? > 0 {
+        let code = line.split("//").next().unwrap_or_default();
+        if code.trim() == mod_line {
+            return Ok(ModLineScan::Found);
+        }
+        ends_with_newline = line.ends_with('\n');
+        line.clear();
+    }
+
+    Ok(ModLineScan::Missing { ends_with_newline })
+}
+
+/// snake_caseに変換（小文字化と区切り文字の置換を一度の走査で行う）
+///
+/// 小文字化は文字単位（`char::to_lowercase`）のため、`str::to_lowercase` と異なり
+/// 語末のシグマを `ς` にしない（`"ΣΑΣ"` は `"σασ"` になる）。
 fn to_snake_case(name: &str) -> String {
-    name.to_lowercase()
-        .replace('-', "_")
-        .replace(' ', "_")
+    let mut result = String::with_capacity(name.len());
+
+    for ch in name.chars() {
+        match ch {
+            '-' | ' ' => result.push('_'),
+            _ => result.extend(ch.to_lowercase()),
+        }
+    }
+
+    result
+}
+
+/// PascalCaseに変換（`_` を取り除き、単語の先頭だけを大文字にする）
+fn to_pascal_case(snake_name: &str) -> String {
+    let mut result = String::with_capacity(snake_name.len());
+    let mut capitalize = true;
+
+    for ch in snake_name.chars() {
+        if ch == '_' {
+            capitalize = true;
+        } else if capitalize {
+            result.extend(ch.to_uppercase());
+            capitalize = false;
+        } else {
+            result.push(ch);
+        }
+    }
+
+    result
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    /// テスト用の一時ディレクトリ（アサーションが失敗してもDropで削除される）
+    struct TempDir(PathBuf);
+
+    impl TempDir {
+        fn new(label: &str) -> Self {
+            let path = std::env::temp_dir().join(format!(
+                "aegis-architect-{}-{}",
+                label,
+                std::process::id()
+            ));
+            let _ = fs::remove_dir_all(&path);
+            fs::create_dir_all(&path).unwrap();
+            Self(path)
+        }
+    }
+
+    impl std::ops::Deref for TempDir {
+        type Target = Path;
+
+        fn deref(&self) -> &Path {
+            &self.0
+        }
+    }
+
+    impl Drop for TempDir {
+        fn drop(&mut self) {
+            let _ = fs::remove_dir_all(&self.0);
+        }
+    }
+
     #[test]
     fn test_to_snake_case() {
         assert_eq!(to_snake_case("MyFeature"), "myfeature");
         assert_eq!(to_snake_case("my-feature"), "my_feature");
         assert_eq!(to_snake_case("my feature"), "my_feature");
+        assert_eq!(to_snake_case("Stock-Price Alert"), "stock_price_alert");
     }
 
     #[test]
     fn test_pascal_case() {
-        assert_eq!("stock_price".to_pascal_case(), "StockPrice");
-        assert_eq!("market_analysis".to_pascal_case(), "MarketAnalysis");
+        assert_eq!(to_pascal_case("stock_price"), "StockPrice");
+        assert_eq!(to_pascal_case("market_analysis"), "MarketAnalysis");
+        assert_eq!(to_pascal_case("_leading__double_"), "LeadingDouble");
+    }
+
+    #[test]
+    fn test_is_constant_template() {
+        assert!(is_constant_template("src/main.rs"));
+        assert!(!is_constant_template("src/domain/{{name}}.rs"));
+        assert!(!is_constant_template("{% if x %}{% endif %}"));
+        assert!(!is_constant_template("{# comment #}"));
+    }
+
+    #[test]
+    fn test_archetype_registry_is_scanned_once() {
+        // 他のテストと共有しないディレクトリを使う
+        let archetypes_dir = TempDir::new("registry-once");
+        fs::create_dir_all(archetypes_dir.join("first")).unwrap();
+        fs::write(
+            archetypes_dir.join("first/manifest.json"),
+            r#"{"name": "first", "displayName": "First", "description": "ok", "files": []}"#,
+        )
+        .unwrap();
+
+        let first = archetype_registry(&archetypes_dir).unwrap();
+
+        // 構築後に追加されたアーキタイプは再走査されないので見えない
+        fs::create_dir_all(archetypes_dir.join("later")).unwrap();
+        fs::write(
+            archetypes_dir.join("later/manifest.json"),
+            r#"{"name": "later", "displayName": "Later", "description": "ok", "files": []}"#,
+        )
+        .unwrap();
+
+        let second = archetype_registry(&archetypes_dir).unwrap();
+        assert!(Arc::ptr_eq(&first, &second));
+        assert!(!second.contains_key("later"));
+
+        let manifest = load_archetype(&archetypes_dir, "first").unwrap();
+        assert!(Arc::ptr_eq(&manifest, first["first"].as_ref().unwrap()));
+    }
+
+    #[test]
+    fn test_broken_manifest_only_affects_its_own_archetype() {
+        let archetypes_dir = TempDir::new("registry");
+        fs::create_dir_all(archetypes_dir.join("good")).unwrap();
+        fs::create_dir_all(archetypes_dir.join("broken")).unwrap();
+        fs::write(
+            archetypes_dir.join("good/manifest.json"),
+            r#"{"name": "good", "displayName": "Good", "description": "ok", "files": []}"#,
+        )
+        .unwrap();
+        fs::write(archetypes_dir.join("broken/manifest.json"), "{").unwrap();
+
+        let good = load_archetype(&archetypes_dir, "good").unwrap();
+        assert_eq!(good.name, "good");
+
+        let broken = load_archetype(&archetypes_dir, "broken")
+            .unwrap_err()
+            .to_string();
+        assert!(broken.starts_with("Failed to load archetype 'broken'"));
+
+        let missing = load_archetype(&archetypes_dir, "missing")
+            .unwrap_err()
+            .to_string();
+        assert!(missing.ends_with("Available: good"));
+
+        assert!(load_all_archetypes(&archetypes_dir).is_err());
+    }
+
+    #[test]
+    fn test_scaffold_feature_renders_bundled_archetypes() {
+        let archetypes_dir = Path::new(env!("CARGO_MANIFEST_DIR")).join("../archetypes");
+        let target = TempDir::new("scaffold");
+
+        let hexagonal = target.join("hexagonal");
+        scaffold_feature(
+            &archetypes_dir,
+            "Stock-Price",
+            "株価",
+            "rust_hexagonal",
+            &hexagonal,
+            true,
+            None,
+        )
+        .unwrap();
+
+        let domain = fs::read_to_string(hexagonal.join("src/domain/stock_price.rs")).unwrap();
+        assert!(domain.starts_with("//! Domain: stock_price\n//! 株価\n"));
+        assert!(!domain.contains("{{"));
+        let adapter =
+            fs::read_to_string(hexagonal.join("src/adapters/stock_price_adapter.rs")).unwrap();
+        assert!(adapter.contains(
+            "use crate::domain::stock_price::{StockPriceRequest, StockPriceResponse, StockPriceError};"
+        ));
+        assert!(hexagonal.join("src/ports/stock_price_port.rs").is_file());
+        assert_eq!(
+            fs::read_to_string(hexagonal.join("src/ports/mod.rs")).unwrap(),
+            "pub mod stock_price_port;\n"
+        );
+
+        let cli = target.join("cli");
+        scaffold_feature(
+            &archetypes_dir,
+            "my_tool",
+            "便利ツール",
+            "rust_cli_simple",
+            &cli,
+            true,
+            None,
+        )
+        .unwrap();
+
+        let cargo_toml = fs::read_to_string(cli.join("Cargo.toml")).unwrap();
+        assert!(cargo_toml.contains("name = \"my_tool\""));
+        assert!(cargo_toml.contains("description = \"便利ツール\""));
+        let main_rs = fs::read_to_string(cli.join("src/main.rs")).unwrap();
+        assert!(main_rs.contains("println!(\"MyTool starting...\");"));
+        // mod.rsの更新はrust_hexagonalのみ
+        assert!(!cli.join("src/domain").exists());
+    }
+
+    #[test]
+    fn test_write_files_reports_failing_path() {
+        let target = TempDir::new("write");
+        fs::create_dir_all(target.join("occupied")).unwrap();
+
+        // SEQUENTIAL_WRITE_LIMITを超える件数でスレッド経由の経路も通す
+        let mut files: Vec<_> = (0..SEQUENTIAL_WRITE_LIMIT + 2)
+            .map(|i| (target.join(format!("file_{}.rs", i)), format!("// {}\n", i)))
+            .collect();
+        files.push((target.join("occupied"), String::new()));
+
+        let results = write_files(&files);
+        assert_eq!(results.len(), files.len());
+        for ((path, contents), result) in files.iter().zip(&results).take(files.len() - 1) {
+            assert!(result.is_ok());
+            assert_eq!(&fs::read_to_string(path).unwrap(), contents);
+        }
+        let error = results.last().unwrap().as_ref().unwrap_err().to_string();
+        assert!(error.starts_with("Failed to write file:"));
+        assert!(error.contains("occupied"));
+    }
+
+    #[test]
+    fn test_update_mod_files_is_idempotent() {
+        let target = TempDir::new("mod");
+        fs::create_dir_all(target.join("src/domain")).unwrap();
+        fs::write(target.join("src/domain/mod.rs"), "pub mod existing;\n").unwrap();
+
+        assert_eq!(update_mod_files(&target, "stock_price").unwrap().len(), 3);
+        assert!(update_mod_files(&target, "stock_price").unwrap().is_empty());
+        assert_eq!(
+            fs::read_to_string(target.join("src/domain/mod.rs")).unwrap(),
+            "pub mod existing;\npub mod stock_price;\n"
+        );
+    }
+
+    #[test]
+    fn test_update_mod_file_ignores_comments_and_fixes_missing_newline() {
+        let target = TempDir::new("mod-line");
+
+        let commented = target.join("commented.rs");
+        fs::write(&commented, "pub mod stock_price; // note\n").unwrap();
+        assert!(!update_mod_file(&commented, "pub mod stock_price;").unwrap());
+        assert_eq!(
+            fs::read_to_string(&commented).unwrap(),
+            "pub mod stock_price; // note\n"
+        );
+
+        let commented_out = target.join("commented_out.rs");
+        fs::write(&commented_out, "// pub mod stock_price;\n").unwrap();
+        assert!(update_mod_file(&commented_out, "pub mod stock_price;").unwrap());
+        assert_eq!(
+            fs::read_to_string(&commented_out).unwrap(),
+            "// pub mod stock_price;\npub mod stock_price;\n"
+        );
+
+        let no_newline = target.join("no_newline.rs");
+        fs::write(&no_newline, "pub mod existing;").unwrap();
+        assert!(update_mod_file(&no_newline, "pub mod stock_price;").unwrap());
+        assert_eq!(
+            fs::read_to_string(&no_newline).unwrap(),
+            "pub mod existing;\npub mod stock_price;\n"
+        );
     }
 }